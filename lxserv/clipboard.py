@@ -26,10 +26,10 @@ import logging
 import json
 import sys
 import subprocess
+import shutil
 from datetime import datetime
 import os
 import tempfile
-import pathlib
 import math
 
 use_msgpack = False
@@ -39,48 +39,127 @@ try:
 except ImportError:
     msgpack = None
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# block size for writing the temporary file
+WRITE_BLOCK_SIZE = 1 << 20
+
+# OS clipboard stalls on larger CPMF data
+CLIPBOARD_SIZE_LIMIT = 4 << 20
+
+# store CPMF data over CLIPBOARD_SIZE_LIMIT to the temporary file and put a
+# marker holding its path on the OS clipboard (not readable by Blender yet)
+use_clipboard_tempfile = False
+
 i_VMAP_SEAM = 1397047629
 
+# CPMF header fields which never change between exports
+CPMF_HEADER = {
+    'type': 'CPMF',
+    'version': '1.0',
+}
+CPMF_METADATA = {
+    'source_app': 'Modo',
+    'coordinate_system': 'y_up_rh',
+    'unit_scale': 1.0,
+}
+
 # ---------- Clipboard helpers ----------
 try:
     import pyperclip
 
     def clipboard_copy(text):
+        if isinstance(text, (bytes, bytearray, memoryview)):
+            text = bytes(text).decode('utf-8')
         pyperclip.copy(text)
 
     def clipboard_paste():
         return pyperclip.paste()
 except Exception:
+    # clipboard tools are looked up once at import
+    clipboard_copy_cmd = None
+    clipboard_paste_cmd = None
+    if sys.platform == 'darwin':
+        clipboard_copy_cmd = ['pbcopy']
+        clipboard_paste_cmd = ['pbpaste']
+    elif sys.platform.startswith('linux'):
+        if os.environ.get('WAYLAND_DISPLAY') and shutil.which('wl-copy'):
+            clipboard_copy_cmd = ['wl-copy']
+            clipboard_paste_cmd = ['wl-paste', '--no-newline']
+        elif shutil.which('xclip'):
+            clipboard_copy_cmd = ['xclip', '-selection', 'clipboard']
+            clipboard_paste_cmd = ['xclip', '-selection', 'clipboard', '-o']
+        elif shutil.which('xsel'):
+            clipboard_copy_cmd = ['xsel', '--clipboard', '--input']
+            clipboard_paste_cmd = ['xsel', '--clipboard', '--output']
+    elif sys.platform.startswith('win'):
+        clipboard_copy_cmd = [
+            'powershell', '-NoProfile', '-Command',
+            'Set-Clipboard -Value ([Text.Encoding]::Utf8.GetString('
+            '[Text.Encoding]::Utf8.GetBytes($input))))'
+        ]
+        clipboard_paste_cmd = ['powershell', '-NoProfile', '-Command', 'Get-Clipboard']
+
     def clipboard_copy(text):
-        if sys.platform == 'darwin':
-            p = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE)
-            p.communicate(text.encode('utf-8'))
-        elif sys.platform.startswith('linux'):
-            p = subprocess.Popen(
-                ['xclip', '-selection', 'clipboard'],
-                stdin=subprocess.PIPE
-            )
-            p.communicate(text.encode('utf-8'))
-        elif sys.platform.startswith('win'):
-            cmd = [
-                'powershell', '-NoProfile', '-Command',
-                'Set-Clipboard -Value ([Text.Encoding]::Utf8.GetString('
-                '[Text.Encoding]::Utf8.GetBytes($input))))'
-            ]
-            p = subprocess.Popen(cmd, stdin=subprocess.PIPE)
-            p.communicate(text.encode('utf-8'))
-        else:
+        if clipboard_copy_cmd is None:
             raise RuntimeError('No clipboard method')
+        # the tools read UTF-8 from stdin, so encoded bytes go as is
+        if isinstance(text, str):
+            text = text.encode('utf-8')
+        subprocess.run(clipboard_copy_cmd, input=text, check=True)
 
     def clipboard_paste():
-        if sys.platform == 'darwin':
-            return subprocess.check_output(['pbpaste']).decode('utf-8')
-        elif sys.platform.startswith('linux'):
-            return subprocess.check_output(['xclip','-selection','clipboard','-o']).decode('utf-8')
-        elif sys.platform.startswith('win'):
-            return subprocess.check_output(['powershell','-NoProfile','-Command','Get-Clipboard']).decode('utf-8')
-        else:
+        if clipboard_paste_cmd is None:
             raise RuntimeError('No clipboard method')
+        return subprocess.check_output(clipboard_paste_cmd).decode('utf-8')
+
+# set CPMF_DEBUG=1 to log command and per-map progress messages
+debug_log = os.environ.get('CPMF_DEBUG') == '1'
+
+# ---------- JSON helpers ----------
+# set CPMF_PRETTY=1 to write indented JSON for debugging
+pretty_json = os.environ.get('CPMF_PRETTY') == '1'
+
+def dump_json(data):
+    """
+    Serialize data to UTF-8 encoded JSON bytes. orjson is used if installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty_json else 0)
+        except TypeError:
+            # types orjson does not know about go through json module
+            pass
+    if pretty_json:
+        return json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def load_json(txt):
+    if orjson is not None:
+        return orjson.loads(txt)
+    return json.loads(txt)
+
+# ---------- msgpack helpers ----------
+def dump_msgpack(data):
+    """
+    Serialize data to msgpack bytes. msgspec is used if installed.
+    """
+    if msgspec is not None:
+        return msgspec.msgpack.encode(data)
+    return msgpack.packb(data, use_bin_type=True)
+
+def load_msgpack(buf):
+    if msgspec is not None:
+        return msgspec.msgpack.decode(buf)
+    return msgpack.unpackb(buf, raw=False)
 
 # ---------- small helpers ----------
 def get_cpmf_tempfile_path(use_bin=False):
@@ -92,46 +171,79 @@ def get_cpmf_tempfile_path(use_bin=False):
     return path
 
 def write_tempfile(data, path=None):
-    global use_msgpack
     """
-    Write binary data to path if provided; otherwise create in OS tempdir
-    and return path.
+    Write data to path if provided; otherwise create in OS tempdir and
+    return path. data is encoded bytes, str stored as UTF-8, or a CPMF dict
+    which is packed to msgpack or JSON depending on the file suffix.
     """
+    global use_msgpack
     if path is None:
         path = get_cpmf_tempfile_path(use_bin=use_msgpack)
-    suffixes = [s.lower() for s in pathlib.Path(path).suffixes]
-    use_binary = '.bin' in suffixes and use_msgpack
     d = os.path.dirname(path)
     if d and not os.path.exists(d):
         try:
             os.makedirs(d, exist_ok=True)
         except Exception:
             pass
-    if use_binary:
-        with open(path, 'wb') as f:
-            f.write(data)
-    else:
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(data)
+    if isinstance(data, dict):
+        if path.lower().endswith('.bin') and use_msgpack:
+            data = dump_msgpack(data)
+        else:
+            data = dump_json(data)
+    elif isinstance(data, str):
+        data = data.encode('utf-8')
+    # write to a uniquely named sibling file and rename it over the path, so
+    # the reader never sees a partially written file
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=d or None)
+    try:
+        try:
+            # mkstemp creates the file private to the user
+            os.chmod(tmp_path, 0o644)
+            mv = memoryview(data)
+            offset = 0
+            while offset < len(mv):
+                offset += os.write(fd, mv[offset:offset + WRITE_BLOCK_SIZE])
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
     return os.path.abspath(path)
 
+def resolve_tempfile_path(path):
+    """
+    Return the file read_tempfile reads for path. A missing binary file
+    falls back to its JSON sibling, which the other app may have written.
+    """
+    use_binary = path.lower().endswith('.bin') and use_msgpack
+    if use_binary and not os.path.exists(path):
+        return os.path.splitext(path)[0] + '.json'
+    return path
+
 def read_tempfile(path):
+    """
+    Read the temporary file and return the decoded CPMF dict.
+    """
     global use_msgpack
     if path is None:
         path = get_cpmf_tempfile_path(use_bin=use_msgpack)
-    suffixes = [s.lower() for s in pathlib.Path(path).suffixes]
-    use_binary = '.bin' in suffixes and use_msgpack
+    path = resolve_tempfile_path(path)
+    p_lower = path.lower()
+    use_binary = p_lower.endswith('.bin') and use_msgpack
     # try binary first
     if use_binary:
-        if os.path.exists(path):
-            with open(path, 'rb') as f:
-                return f.read()
-        else:
-            return None
+        with open(path, 'rb') as f:
+            return load_msgpack(f.read())
     # then json
-    elif '.json' in suffixes:
-        with open(path, 'r', encoding='utf-8') as f:
-            return f.read()
+    elif p_lower.endswith('.json'):
+        # both JSON loaders take UTF-8 bytes directly
+        with open(path, 'rb') as f:
+            return load_json(f.read())
     else:
         raise RuntimeError('Unsupported file format')
 
@@ -170,29 +282,50 @@ def mat3_mul_vec3(M, v):
 
     戻り値: (x', y', z') のタプル
     """
-    x = M[0][0] * v[0] + M[0][1] * v[1] + M[0][2] * v[2]
-    y = M[1][0] * v[0] + M[1][1] * v[1] + M[1][2] * v[2]
-    z = M[2][0] * v[0] + M[2][1] * v[1] + M[2][2] * v[2]
+    m0, m1, m2 = M[0], M[1], M[2]
+    v0, v1, v2 = v[0], v[1], v[2]
+    x = m0[0] * v0 + m0[1] * v1 + m0[2] * v2
+    y = m1[0] * v0 + m1[1] * v1 + m1[2] * v2
+    z = m2[0] * v0 + m2[1] * v1 + m2[2] * v2
+
+    return (x, y, z)
 
-    return modo.Vector3((x, y, z))
 
+# --- Polygon helpers ---
+def has_bridge_edge(vertices):
+    """
+    True if an edge of the vertex loop is walked in both directions, which
+    is the bridge edge of a keyhole polygon.
+    """
+    # edges as single int keys, point ids are pointer sized so the
+    # first id is shifted by 64 bits
+    edge_map = set()
+    for i, (id0, id1) in enumerate(zip(vertices, vertices[1:] + vertices[:1])):
+        if i > 2:
+            if (id1 << 64 | id0) in edge_map:
+                return True
+        edge_map.add(id0 << 64 | id1)
+    return False
 
 # --- Vector conversion ---
 def convert_vector_from_coord(vec, src_coord):
+    """
+    Returns (x, y, z) in Modo space. The input sequence is returned as is
+    when no conversion is needed.
+    """
     if not src_coord:
-        return modo.Vector3(vec)
+        return vec
 
     key = src_coord.lower()
-    v = modo.Vector3(vec)
 
     # Blender → Modo
     if "z_up_rh" in key:
-        return mat3_mul_vec3(B2M, v)
+        return mat3_mul_vec3(B2M, vec)
     elif "y_up_lh" in key:
-        return mat3_mul_vec3(L2M, v)
+        return mat3_mul_vec3(L2M, vec)
 
     # Already Modo space
-    return v
+    return vec
 
 # --- Quaternion conversion ---
 def convert_quaternion_from_coord(q_in, src_coord):
@@ -216,7 +349,7 @@ def convert_quaternion_from_coord(q_in, src_coord):
 
 # --- Transform conversion (Location / Rotation / Scale) ---
 def convert_matrix_transform_from_coord(translation, rotation_quat, scale, src_coord):
-    t = convert_vector_from_coord(translation, src_coord)
+    t = modo.Vector3(convert_vector_from_coord(translation, src_coord))
     q = convert_quaternion_from_coord(rotation_quat, src_coord)
     s = modo.Vector3(scale)
     return t, q, s
@@ -224,60 +357,68 @@ def convert_matrix_transform_from_coord(translation, rotation_quat, scale, src_c
 
 # Clipboard class
 class ClipboardData:
+    __slots__ = (
+        'mesh', 'item', 'items', 'scene', 'data', 'materials',
+        'point_accessor', 'edge_accessor', 'polygon_accessor', 'map_accessor',
+        'vertex_ids', 'edge_ids', 'polygon_ids', '_point_index',
+        'vmap_ids', 'vmap_uv_ids', 'vmap_morph_ids', 'vmap_weight_ids',
+        'vmap_color_ids', 'vmap_normal_ids',
+        'mark_select', 'selType', 'base_nvert',
+        'coord', 'unit_scale', 'replace_material', 'import_transform',
+        '_buf_f1', '_buf_f2', '_buf_f3', '_buf_f4', '_buf_pick',
+        '_vmap_info', '_poly_triangulation', '_material_name_to_index',
+        '_image_maps',
+    )
+
     def __init__(self):
         self.mesh = None
         self.vertex_ids = []
         self.edge_ids = []
         self.polygon_ids = []
         self.vmap_ids = []
+        self._point_index = {}
         self.materials = []
+        self._material_name_to_index = {}
+        self._poly_triangulation = {}
+        self._vmap_info = {}
+        self._image_maps = None
         self.mark_select = None
         self.selType = None
         self.base_nvert = 0
         self.items = []
+        # storage buffers reused by the vertex map accessors
+        self._buf_f1 = lx.object.storage('f', 1)
+        self._buf_f2 = lx.object.storage('f', 2)
+        self._buf_f3 = lx.object.storage('f', 3)
+        self._buf_f4 = lx.object.storage('f', 4)
+        # never written, pick maps only need the value to exist
+        self._buf_pick = lx.object.storage('f', 1)
 
     def selected(self, v):
         return v.TestMarks(self.mark_select)
 
-    def selected_point(self, id):
-        v = self.Point(id)
-        return v.TestMarks(self.mark_select)
-
     def selected_polygonn(self, id):
         p = self.Polygon(id)
         return p.TestMarks(self.mark_select)
 
-    def index(self, v):
-        return self.vertex_indices[v.Index()]
-    
     def lookupMap(self, map_type, name):
         for vmap_id in self.vmap_ids:
-            vmap = self.VMap(vmap_id)
-            try:
-                vmap_name = vmap.Name()
-            except:
-                continue
-            if vmap.Type() == map_type and vmap_name == name:
-                return vmap
+            if self._vmap_info[vmap_id] == (map_type, name):
+                return self.VMap(vmap_id)
         return None
     
     def lookupMapAny(self, map_type):
         for vmap_id in self.vmap_ids:
-            vmap = self.VMap(vmap_id)
-            if vmap.Type() == map_type:
-                return vmap
+            if self._vmap_info[vmap_id][0] == map_type:
+                return self.VMap(vmap_id)
         return None
 
     def addMap(self, map_type, name):
         id = self.map_accessor.New(map_type, name)
         self.vmap_ids.append(id)
+        self._vmap_info[id] = (map_type, name)
         return self.VMap(id)
     
-    def newPoint(self, pos):
-        id = self.point_accessor.New(pos)
-        self.vertex_ids.append(id)
-        return self.Point(id)
-    
     def newPolygon(self, vertices):
         points_storage = lx.object.storage()
         points_storage.setType('p')
@@ -287,42 +428,24 @@ class ClipboardData:
         self.polygon_ids.append(id)
         return self.Polygon(id)
 
-    def getWeight(self, vmap, v):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(1)
-        if v.MapValue(vmap.ID(), storage) == False:
-            return None
-        return storage.get()
-
     def getPick(self, vmap, v):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(1)
-        if v.MapValue(vmap.ID(), storage) == False:
+        if v.MapValue(vmap.ID(), self._buf_f1) == False:
             return False
         return True
 
     def getEdgePick(self, vmap, e):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(1)
-        if e.MapValue(vmap.ID(), storage) == False:
+        if e.MapValue(vmap.ID(), self._buf_f1) == False:
             return False
         return True
 
     def getUV(self, vmap, p, point_id):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(2)
+        storage = self._buf_f2
         if p.MapEvaluate(vmap.ID(), point_id, storage) == False:
             return [0.0, 0.0]
         return storage.get()
 
     def getColor(self, vmap, p, point_id):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(4)
+        storage = self._buf_f4
         if p.MapEvaluate(vmap.ID(), point_id, storage) == False:
             return None
         rgba = storage.get()
@@ -332,99 +455,56 @@ class ClipboardData:
             return rgba
 
     def getNormal(self, vmap, p, point_id):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(3)
+        storage = self._buf_f3
         if p.MapEvaluate(vmap.ID(), point_id, storage) == False:
             return None
         vec = storage.get()
         return vec
 
-    def getAbsolutePosition(self, vmap, v):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(3)
-        if v.MapValue(vmap.ID(), storage) == False:
-            return None
-        if vmap.Type() == lx.symbol.i_VMAP_MORPH:
-            pos = v.Pos()
-            return [storage[0] + pos[0], storage[1] + pos[1], storage[2] + pos[2]]
-        else:
-            return [storage[0], storage[1], storage[2]]
+    # values of the vertex map for all selected vertices in vertex_ids order,
+    # None for vertices without value
+    def map_values(self, vmap_id, storage):
+        point = self.point_accessor
+        select = point.Select
+        map_value = point.MapValue
+        get = storage.get
+        values = []
+        append = values.append
+        for point_id in self.vertex_ids:
+            select(point_id)
+            append(get() if map_value(vmap_id, storage) else None)
+        return values
 
     def setWeight(self, vmap, v, weight):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(1)
+        storage = self._buf_f1
         storage.set([weight])
         v.SetMapValue(vmap.ID(), storage)
 
-    def setMorph(self, vmap, v, pos):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(3)
-        storage.set(pos)
-        v.SetMapValue(vmap.ID(), storage)
-
-    def setUV(self, vmap, p, point_id, uv):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(2)
-        storage.set(uv)
-        p.SetMapValue(point_id, vmap.ID(), storage)
-
-    def setCornerColor(self, vmap, p, point_id, color):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(4)
-        storage.set(color)
-        p.SetMapValue(point_id, vmap.ID(), storage)
-
     def setPointColor(self, vmap, v, color):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(4)
+        storage = self._buf_f4
         storage.set(color)
         v.SetMapValue(vmap.ID(), storage)
 
     def setCornerNormal(self, vmap, p, point_id, vec):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(3)
+        storage = self._buf_f3
         storage.set(vec)
         p.SetMapValue(point_id, vmap.ID(), storage)
 
     def setEdgePick(self, vmap, e):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(1)
-        e.SetMapValue(vmap.ID(), storage)
+        e.SetMapValue(vmap.ID(), self._buf_pick)
 
     def setVertexPick(self, vmap, v):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(1)
-        v.SetMapValue(vmap.ID(), storage)
+        v.SetMapValue(vmap.ID(), self._buf_pick)
 
     def setSubdivWeight(self, vmap, e, weight):
-        storage = lx.object.storage()
-        storage.setType('f')
-        storage.setSize(1)
+        storage = self._buf_f1
         storage.set([weight])
         e.SetMapValue(vmap.ID(), storage)
 
-    def PointByIndex(self, index):
-        self.point_accessor.SelectByIndex(index)
-        return self.point_accessor
-
     def PolygonByIndex(self, index):
         self.polygon_accessor.SelectByIndex(index)
         return self.polygon_accessor
 
-    def EdgeByIndex(self, index):
-        self.edge_accessor.SelectByIndex(index)
-        return self.edge_accessor
-
     def EdgeEndpoints(self, id0, id1):
         self.edge_accessor.SelectEndpoints(id0, id1)
         return self.edge_accessor
@@ -520,36 +600,42 @@ class ClipboardData:
         chan_write.Integer(xfrm, chan, rot_order)
 
     def setup_mesh_elements(self):
+        mark_select = self.mark_select
+
         # store selected vertices
-        self.vertex_indices = {}
         self.vertex_ids = []
-        index = 0
+        point = self.point_accessor
+        select_point = point.SelectByIndex
         for i in range(self.mesh.PointCount()):
-            v = self.PointByIndex(i)
-            if self.selected(v):
-                self.vertex_indices[i] = index
-                self.vertex_ids.append(v.ID())
-                index += 1
+            select_point(i)
+            if point.TestMarks(mark_select):
+                self.vertex_ids.append(point.ID())
+
+        # point id to vertex index of the selected vertices
+        self._point_index = {id: i for i, id in enumerate(self.vertex_ids)}
 
-        # store selected edges
+        # store selected edges, both endpoints must be selected vertices
         self.edge_ids = []
+        point_index = self._point_index
+        edge = self.edge_accessor
+        select_edge = edge.SelectByIndex
         for i in range(self.mesh.EdgeCount()):
-            e = self.EdgeByIndex(i)
-            id0, id1 = e.Endpoints()
-            if self.selected_point(id0) and self.selected_point(id1):
-                self.edge_ids.append(e.ID())
+            select_edge(i)
+            id0, id1 = edge.Endpoints()
+            if id0 in point_index and id1 in point_index:
+                self.edge_ids.append(edge.ID())
 
         # store selected polygons
         self.polygon_ids = []
+        polygon = self.polygon_accessor
+        select_polygon = polygon.SelectByIndex
+        surface_types = (lx.symbol.iPTYP_FACE, lx.symbol.iPTYP_SUBD, lx.symbol.iPTYP_PSUB)
         for i in range(self.mesh.PolygonCount()):
-            p = self.PolygonByIndex(i)
-            ptype = p.Type()
-            if ptype != lx.symbol.iPTYP_FACE and \
-               ptype != lx.symbol.iPTYP_SUBD and \
-               ptype != lx.symbol.iPTYP_PSUB:
+            select_polygon(i)
+            if polygon.Type() not in surface_types:
                 continue
-            if self.selected(p):
-                self.polygon_ids.append(p.ID())
+            if polygon.TestMarks(mark_select):
+                self.polygon_ids.append(polygon.ID())
 
         if self.selType == lx.symbol.iSEL_VERTEX:
             return True if len(self.vertex_ids) > 0 else False
@@ -562,16 +648,11 @@ class ClipboardData:
         # store all vertex maps
         class QueryMapsVisitor(lxifc.Visitor):
             def __init__(self, meshmap, vmap_ids):
-                self.meshmap = meshmap
-                self.msv = lx.service.Mesh()
-                self.vmap_ids = vmap_ids
+                self.map_id = meshmap.ID
+                self.append = vmap_ids.append
 
             def vis_Evaluate(self):
-                try:
-                    id = self.meshmap.ID()
-                    self.vmap_ids.append(id)
-                except Exception:
-                    return
+                self.append(self.map_id())
 
         self.vmap_ids = []
         self.vmap_uv_ids = []
@@ -582,21 +663,29 @@ class ClipboardData:
         visitor = QueryMapsVisitor(self.map_accessor, self.vmap_ids)
         self.map_accessor.Enumerate(lx.symbol.iMARK_ANY, visitor, 0)
 
+        # type and name of each vertex map, queried once
+        self._vmap_info = {}
         for vmap_id in self.vmap_ids:
             vmap = self.VMap(vmap_id)
-            if vmap.Type() == lx.symbol.i_VMAP_TEXTUREUV:
+            map_type = vmap.Type()
+            try:
+                name = vmap.Name()
+            except Exception:
+                name = None
+            self._vmap_info[vmap_id] = (map_type, name)
+            if map_type == lx.symbol.i_VMAP_TEXTUREUV:
                 self.vmap_uv_ids.append(vmap_id)
-            elif vmap.Type() == lx.symbol.i_VMAP_MORPH:
+            elif map_type == lx.symbol.i_VMAP_MORPH:
                 self.vmap_morph_ids.append(vmap_id)
-            elif vmap.Type() == lx.symbol.i_VMAP_SPOT:
+            elif map_type == lx.symbol.i_VMAP_SPOT:
                 self.vmap_morph_ids.append(vmap_id)
-            elif vmap.Type() == lx.symbol.i_VMAP_WEIGHT:
+            elif map_type == lx.symbol.i_VMAP_WEIGHT:
                 self.vmap_weight_ids.append(vmap_id)
-            elif vmap.Type() == lx.symbol.i_VMAP_RGB:
+            elif map_type == lx.symbol.i_VMAP_RGB:
                 self.vmap_color_ids.append(vmap_id)
-            elif vmap.Type() == lx.symbol.i_VMAP_RGBA:
+            elif map_type == lx.symbol.i_VMAP_RGBA:
                 self.vmap_color_ids.append(vmap_id)
-            elif vmap.Type() == lx.symbol.i_VMAP_NORMAL:
+            elif map_type == lx.symbol.i_VMAP_NORMAL:
                 self.vmap_normal_ids.append(vmap_id)
             else:
                 continue
@@ -629,14 +718,8 @@ class ClipboardData:
 
         # CPMF data
         data = {
-            'type': 'CPMF',
-            'version': '1.0',
-            'metadata': {
-                'source_app': 'Modo',
-                'coordinate_system': 'y_up_rh',
-                'unit_scale': 1.0,
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
-            },
+            **CPMF_HEADER,
+            'metadata': {**CPMF_METADATA, 'timestamp': datetime.utcnow().isoformat() + 'Z'},
             'objects': []
         }
 
@@ -651,128 +734,29 @@ class ClipboardData:
             if parent is not None and parent not in items:
                 items.append(parent)
                 locators.append(parent)
+        # item name to the indices in items, in items order
+        item_indices = {}
+        for i, ref in enumerate(items):
+            item_indices.setdefault(modo.Item(ref).name, []).append(i)
 
+        # export mesh layers one by one, the SDK accessors are not thread safe
         for layer_index in range(layer_scan.Count()):
-            # setup the accessor
-            self.item = lx.object.Item (layer_scan.MeshItem (layer_index))
-            self.mesh = lx.object.Mesh (layer_scan.MeshBase (layer_index))
-            self.edge_accessor = lx.object.Edge (self.mesh.EdgeAccessor ())
-            self.point_accessor = lx.object.Point (self.mesh.PointAccessor ())
-            self.polygon_accessor = lx.object.Polygon (self.mesh.PolygonAccessor ())
-            self.map_accessor = lx.object.MeshMap (self.mesh.MeshMapAccessor ())
-
-            order = self.getRotOrder()
-
-            modo_item = modo.Mesh(self.item)
-            pos = modo_item.position.get()
-            scl = modo_item.scale.get()
-            rot = modo_item.rotation.get()
-            quat = modo.Quaternion()
-            quat.fromMatrix4(modo.Matrix4().fromEuler(rot,order))
-
-            # store all selected mesh elements
-            selected = self.setup_mesh_elements()
-            if not selected:
-                self.selType = lx.symbol.iSEL_POLYGON
-
-            # store all vertex maps
-            self.setup_vmap_ids()
-
-            # mesh object data
-            cobj = {
-                'name': self.item.UniqueName(),
-                'type': 'MESH',
-                'object_transform': {
-                    'translation': [pos[0], pos[1], pos[2]],
-                    'rotation_euler': [rot[0], rot[1], rot[2], order],
-                    'rotation_quat': [quat[3], quat[0], quat[1], quat[2]],
-                    'scale': [scl[0], scl[1], scl[2]]
-                },
-            }
-
-            parent = self.get_item_parent(self.item, items)
-            if parent is not None:
-                cobj['parent'] = parent
-
-            cobj['mesh'] = {}
-
-            # Query Existing Materials
-            materials = self.copy_materials()
-            if materials:
-                cobj['mesh']['materials'] = materials
-
-            # vertices
-            positions = self.copy_vertices()
-            if positions:
-                cobj['mesh']['positions'] = positions
-
-            # edges
-            edges = self.copy_edges()
-            if edges:
-                cobj['mesh']['edges'] = edges
-
-            # polygons
-            polygons = self.copy_polygons()
-            if polygons:
-                cobj['mesh']['polygons'] = polygons
-
-            # export UV maps
-            uv_sets = self.copy_uv_sets()
-            if uv_sets:
-                cobj['mesh']['uv_sets'] = uv_sets
-
-            # export morph maps
-            shapekeys = self.copy_vertex_shapekeys()
-            if shapekeys:
-                cobj['mesh']['shapekeys'] = shapekeys
-
-            # export weight maps
-            vertex_groups = self.copy_vertex_groups()
-            if vertex_groups:
-                cobj['mesh']['vertex_groups'] = vertex_groups
-
-            # export freestyle edges
-            freestyle_edges = self.copy_edge_freestyle()
-            if freestyle_edges:
-                cobj['mesh']['freestyle_edges'] = freestyle_edges
-
-            # export freestyle faces
-            freestyle_faces = self.copy_face_freestyle()
-            if freestyle_faces:
-                cobj['mesh']['freestyle_faces'] = freestyle_faces
-
-            # export RGBA maps
-            colors = self.copy_colors()
-            if colors:
-                cobj['mesh']['colors'] = colors
-
-            # export selection sets
-            selection_sets = self.copy_selection_sets()
-            if selection_sets:
-                cobj['mesh']['selection_sets'] = selection_sets
-
-            # export vertex normals
-            normals = self.copy_normals()
-            if normals:
-                cobj['mesh']['normals'] = normals
-
+            cobj = self.copy_layer(layer_scan, layer_index, items, item_indices)
             data['objects'].append(cobj)
 
         # copy locator items for parenting
-        self.copy_locators(data, locators, items)
+        self.copy_locators(data, locators, items, item_indices)
 
         lx.out(f'Generated CPMF v1.0 data {external_clipboard}')
 
         # msgpack / JSON dump
         if external_clipboard == 'tempfile' and use_msgpack:
-            try:
-                txt = msgpack.packb(data)
-            except Exception as e:
-                logging.error(f'Failed to dump msgpack: {e}')
-                return False
+            # write_tempfile packs the dict directly without JSON text
+            txt = data
         else:
             try:
-                txt = json.dumps(data, indent=4)
+                # encode once and hand the same buffer to file or clipboard
+                txt = dump_json(data)
             except Exception as e:
                 logging.error(f'Failed to dump JSON: {e}')
                 return False
@@ -788,6 +772,19 @@ class ClipboardData:
                 return False
         # Clipboard
         else:
+            if len(txt) > CLIPBOARD_SIZE_LIMIT:
+                if use_clipboard_tempfile:
+                    path = get_cpmf_tempfile_path()
+                    lx.out(f'CPMF data exceeds {CLIPBOARD_SIZE_LIMIT} bytes, stored to temporary file: {path}')
+                    try:
+                        path = write_tempfile(txt, path)
+                    except Exception as e:
+                        logging.error(f'Failed to write file: {e}')
+                        return False
+                    # the clipboard only holds the path of the temporary file
+                    txt = dump_json({**CPMF_HEADER, 'tempfile': path})
+                else:
+                    lx.out(f'CPMF data is {len(txt)} bytes, use Temporary File for large meshes')
             try:
                 clipboard_copy(txt)
             except Exception as e:
@@ -797,6 +794,116 @@ class ClipboardData:
         lx.out('CPMF v1.0 export completed')
         return True
 
+    # export a mesh layer of the layer scan as CPMF object data
+    def copy_layer(self, layer_scan, layer_index, items, item_indices):
+        # setup the accessor
+        self.item = lx.object.Item (layer_scan.MeshItem (layer_index))
+        self.mesh = lx.object.Mesh (layer_scan.MeshBase (layer_index))
+        self.edge_accessor = lx.object.Edge (self.mesh.EdgeAccessor ())
+        self.point_accessor = lx.object.Point (self.mesh.PointAccessor ())
+        self.polygon_accessor = lx.object.Polygon (self.mesh.PolygonAccessor ())
+        self.map_accessor = lx.object.MeshMap (self.mesh.MeshMapAccessor ())
+
+        order = self.getRotOrder()
+
+        modo_item = modo.Mesh(self.item)
+        pos = modo_item.position.get()
+        scl = modo_item.scale.get()
+        rot = modo_item.rotation.get()
+        quat = modo.Quaternion()
+        quat.fromMatrix4(modo.Matrix4().fromEuler(rot,order))
+
+        # store all selected mesh elements
+        selected = self.setup_mesh_elements()
+        if not selected:
+            self.selType = lx.symbol.iSEL_POLYGON
+
+        # triangulate keyhole polygons
+        self.setup_triangulation()
+
+        # store all vertex maps
+        self.setup_vmap_ids()
+
+        # mesh object data
+        cobj = {
+            'name': self.item.UniqueName(),
+            'type': 'MESH',
+            'object_transform': {
+                'translation': [pos[0], pos[1], pos[2]],
+                'rotation_euler': [rot[0], rot[1], rot[2], order],
+                'rotation_quat': [quat[3], quat[0], quat[1], quat[2]],
+                'scale': [scl[0], scl[1], scl[2]]
+            },
+        }
+
+        parent = self.get_item_parent(self.item, items, item_indices)
+        if parent is not None:
+            cobj['parent'] = parent
+
+        cobj['mesh'] = {}
+
+        # Query Existing Materials
+        materials = self.copy_materials()
+        if materials:
+            cobj['mesh']['materials'] = materials
+
+        # vertices
+        positions = self.copy_vertices()
+        if positions:
+            cobj['mesh']['positions'] = positions
+
+        # edges
+        edges = self.copy_edges()
+        if edges:
+            cobj['mesh']['edges'] = edges
+
+        # polygons
+        polygons = self.copy_polygons()
+        if polygons:
+            cobj['mesh']['polygons'] = polygons
+
+        # export UV maps
+        uv_sets = self.copy_uv_sets()
+        if uv_sets:
+            cobj['mesh']['uv_sets'] = uv_sets
+
+        # export morph maps
+        shapekeys = self.copy_vertex_shapekeys()
+        if shapekeys:
+            cobj['mesh']['shapekeys'] = shapekeys
+
+        # export weight maps
+        vertex_groups = self.copy_vertex_groups()
+        if vertex_groups:
+            cobj['mesh']['vertex_groups'] = vertex_groups
+
+        # export freestyle edges
+        freestyle_edges = self.copy_edge_freestyle()
+        if freestyle_edges:
+            cobj['mesh']['freestyle_edges'] = freestyle_edges
+
+        # export freestyle faces
+        freestyle_faces = self.copy_face_freestyle()
+        if freestyle_faces:
+            cobj['mesh']['freestyle_faces'] = freestyle_faces
+
+        # export RGBA maps
+        colors = self.copy_colors()
+        if colors:
+            cobj['mesh']['colors'] = colors
+
+        # export selection sets
+        selection_sets = self.copy_selection_sets()
+        if selection_sets:
+            cobj['mesh']['selection_sets'] = selection_sets
+
+        # export vertex normals
+        normals = self.copy_normals()
+        if normals:
+            cobj['mesh']['normals'] = normals
+
+        return cobj
+
     # test if item type or superType is equal to test
     def itemTypeTest(self, modo_item, test):
         scene_svc = lx.service.Scene()
@@ -808,7 +915,7 @@ class ClipboardData:
         return False
 
     # copy locator items for parenting
-    def copy_locators(self, data, locators, items):
+    def copy_locators(self, data, locators, items, item_indices):
         for locator in locators:
             self.item = lx.object.Item(locator)
             order = self.getRotOrder()
@@ -833,67 +940,70 @@ class ClipboardData:
                     'scale': [scl[0], scl[1], scl[2]]
                 },
             }
-            parent = self.get_item_parent(self.item, items)
+            parent = self.get_item_parent(self.item, items, item_indices)
             if parent is not None:
                 cobj['parent'] = parent
             data['objects'].append(cobj)
     
     # get item parent index
-    def get_item_parent(self, item, items):
+    def get_item_parent(self, item, items, item_indices):
         modo_item = modo.Item(item)
         parent = modo_item.parent
         if parent == None:
             return None
-        for i, ref in enumerate(items):
-            if ref == item:
-                continue
-            modo_ref = modo.Item(ref)
-            if modo_ref.name == parent.name:
+        # first item with the parent's name, other than the item itself
+        for i in item_indices.get(parent.name, ()):
+            if items[i] != item:
                 return i
         return None
 
-    def get_material_index(self, name, material_out):
-        for i, mat in enumerate(material_out):
-            if mat['name'] == name:
-                return i
-        return 0
+    def get_material_index(self, name):
+        return self._material_name_to_index.get(name, 0)
+
+    # triangulate keyhole polygons once for all exporters
+    def setup_triangulation(self):
+        self._poly_triangulation = {}
+        for poly_id in self.polygon_ids:
+            p = self.Polygon(poly_id)
+            if self.is_keyhole(p):
+                self._poly_triangulation[poly_id] = [p.TriangleByIndex(j) for j in range(p.GenerateTriangles())]
+
+    # number of output faces of the polygon
+    def face_count(self, poly_id):
+        triangles = self._poly_triangulation.get(poly_id)
+        return len(triangles) if triangles is not None else 1
+
+    # point ids of the output faces of the polygon p selected by poly_id,
+    # keyhole is split into triangles
+    def face_corners(self, poly_id, p):
+        triangles = self._poly_triangulation.get(poly_id)
+        if triangles is not None:
+            return triangles
+        return [[p.VertexByIndex(j) for j in range(p.VertexCount())]]
 
     def copy_uv_sets(self):
         if len(self.polygon_ids) == 0:
             return None
         uv_sets = []
+        Polygon = self.Polygon
+        face_corners = self.face_corners
+        getUV = self.getUV
         for vmap_id in self.vmap_uv_ids:
             vmap = self.VMap(vmap_id)
             uv_set = {
-                'name': vmap.Name(),
+                'name': self._vmap_info[vmap_id][1],
                 'uvs': []
             }
+            append = uv_set['uvs'].append
             i = 0
             for poly_id in self.polygon_ids:
-                p = self.Polygon(poly_id)
-                if self.is_keyhole(p):
-                    count = p.GenerateTriangles()
-                    for j in range(count):
-                        face_uvs = {
-                            'index': i,
-                            'values': []
-                        }
-                        i += 1
-                        for point_id in p.TriangleByIndex(j):
-                            uv = self.getUV(vmap, p, point_id)
-                            face_uvs['values'].append([uv[0], uv[1]])
-                        uv_set['uvs'].append(face_uvs)
-                else:
-                    face_uvs = {
+                p = Polygon(poly_id)
+                for corners in face_corners(poly_id, p):
+                    append({
                         'index': i,
-                        'values': []
-                    }
+                        'values': [list(getUV(vmap, p, point_id)) for point_id in corners]
+                    })
                     i += 1
-                    for j in range(p.VertexCount()):
-                        point_id = p.VertexByIndex(j)
-                        uv = self.getUV(vmap, p, point_id)
-                        face_uvs['values'].append([uv[0], uv[1]])
-                    uv_set['uvs'].append(face_uvs)
             uv_sets.append(uv_set)
         if len(uv_sets) == 0:
             return None
@@ -903,52 +1013,30 @@ class ClipboardData:
         if len(self.polygon_ids) == 0:
             return None
         colors = []
+        Polygon = self.Polygon
+        face_corners = self.face_corners
+        getColor = self.getColor
         for vmap_id in self.vmap_color_ids:
             vmap = self.VMap(vmap_id)
             color = {
-                'name': vmap.Name(),
+                'name': self._vmap_info[vmap_id][1],
                 'domain': 'CORNER',
                 'data_type': 'FLOAT_COLOR',
                 'colors': []
             }
             i = 0
             for poly_id in self.polygon_ids:
-                p = self.Polygon(poly_id)
-                if self.is_keyhole(p):
-                    count = p.GenerateTriangles()
-                    for j in range(count):
-                        face_color = {
+                p = Polygon(poly_id)
+                for corners in face_corners(poly_id, p):
+                    values = [getColor(vmap, p, point_id) for point_id in corners]
+                    n = len(values) - values.count(None)
+                    values = [[0.0, 0.0, 0.0, 0.0] if rgba is None else list(rgba) for rgba in values]
+                    if n > 0:
+                        color['colors'].append({
                             'index': i,
-                            'values': []
-                        }
-                        i += 1
-                        n = 0
-                        for point_id in p.TriangleByIndex(j):
-                            rgba = self.getColor(vmap, p, point_id)
-                            if rgba is None:
-                                face_color['values'].append([0.0, 0.0, 0.0, 0.0])
-                            else:
-                                face_color['values'].append([rgba[0], rgba[1], rgba[2], rgba[3]])
-                                n += 1
-                        if n > 0:
-                            color['colors'].append(face_color)
-                else:
-                    face_color = {
-                        'index': i,
-                        'values': []
-                    }
+                            'values': values
+                        })
                     i += 1
-                    n = 0
-                    for j in range(p.VertexCount()):
-                        point_id = p.VertexByIndex(j)
-                        rgba = self.getColor(vmap, p, point_id)
-                        if rgba is None:
-                            face_color['values'].append([0.0, 0.0, 0.0, 0.0])
-                        else:
-                            face_color['values'].append([rgba[0], rgba[1], rgba[2], rgba[3]])
-                            n += 1
-                    if n > 0:
-                        color['colors'].append(face_color)
             colors.append(color)
         if len(colors) == 0:
             return None
@@ -959,16 +1047,14 @@ class ClipboardData:
             return None
         vertex_groups = []
         for vmap_id in self.vmap_weight_ids:
-            vmap = self.VMap(vmap_id)
             vg_data = {
-                'name': vmap.Name(),
+                'name': self._vmap_info[vmap_id][1],
                 'weights': []
             }
-            for point_id in self.vertex_ids:
-                v = self.Point(point_id)
-                w = self.getWeight(vmap, v)
+            append = vg_data['weights'].append
+            for i, w in enumerate(self.map_values(vmap_id, self._buf_f1)):
                 if w is not None and w[0] != 0.0:
-                    vg_data['weights'].append({'index': self.index(v), 'weight': w[0]})
+                    append({'index': i, 'weight': w[0]})
             vertex_groups.append(vg_data)
         if len(vertex_groups) == 0:
             return None
@@ -986,31 +1072,36 @@ class ClipboardData:
             'relative': True,
             'positions': []
         }
+        base_positions = []
         for point_id in self.vertex_ids:
             v = self.Point(point_id)
             pos = v.Pos()
-            sk_data['positions'].append({'index': self.index(v), 'position':[pos[0], pos[1], pos[2]]})
+            base_positions.append((pos[0], pos[1], pos[2]))
+        for i, pos in enumerate(base_positions):
+            sk_data['positions'].append({'index': i, 'position':[pos[0], pos[1], pos[2]]})
         shapekeys.append(sk_data)
         # Add all morph and spot vertex maps
         for vmap_id in self.vmap_morph_ids:
-            vmap = self.VMap(vmap_id)
-            if vmap.Type() == lx.symbol.i_VMAP_SPOT:
+            map_type, name = self._vmap_info[vmap_id]
+            if map_type == lx.symbol.i_VMAP_SPOT:
                 relative = False
-            elif vmap.Type() == lx.symbol.i_VMAP_MORPH:
+            elif map_type == lx.symbol.i_VMAP_MORPH:
                 relative = True
             else:
                 continue
             sk_data = {
-                'name': vmap.Name(),
+                'name': name,
                 'relative': relative,
                 'positions': []
             }
-            for point_id in self.vertex_ids:
-                v = self.Point(point_id)
-                co = self.getAbsolutePosition(vmap, v)
+            for i, co in enumerate(self.map_values(vmap_id, self._buf_f3)):
                 if co is None:
                     continue
-                sk_data['positions'].append({'index': self.index(v), 'position':[co[0], co[1], co[2]]})
+                # morph values are offsets from the base position
+                if relative:
+                    pos = base_positions[i]
+                    co = (co[0] + pos[0], co[1] + pos[1], co[2] + pos[2])
+                sk_data['positions'].append({'index': i, 'position':[co[0], co[1], co[2]]})
             shapekeys.append(sk_data)
         if len(shapekeys) == 0:
             return None
@@ -1021,17 +1112,14 @@ class ClipboardData:
             return None
         freestyle_edges = []
         for vmap_id in self.vmap_ids:
-            vmap = self.VMap(vmap_id)
-            if vmap.Type() != lx.symbol.i_VMAP_EPCK:
-                continue
-            if vmap.Name() != '_Freestyle':
+            if self._vmap_info[vmap_id] != (lx.symbol.i_VMAP_EPCK, '_Freestyle'):
                 continue
             for edge_id in self.edge_ids:
                 e = self.Edge(edge_id)
                 storageBuffer = lx.object.storage('f', 1)
                 if e.MapEvaluate(vmap_id, storageBuffer) == True:
                     id0, id1 = e.Endpoints()
-                    freestyle_edges.append({'vertices': [self.index(self.Point(id0)), self.index(self.Point(id1))], 'use_freestyle_mark': 1})
+                    freestyle_edges.append({'vertices': [self._point_index[id0], self._point_index[id1]], 'use_freestyle_mark': 1})
         if len(freestyle_edges) == 0:
             return None
         return freestyle_edges
@@ -1044,10 +1132,7 @@ class ClipboardData:
         i = 0
         for poly_id in self.polygon_ids:
             p = self.Polygon(poly_id)
-            if self.is_keyhole(p):
-                count = p.GenerateTriangles()
-            else:
-                count = 1
+            count = self.face_count(poly_id)
             tagString = self.PartTag(p)
             if tagString is None:
                 i += count
@@ -1074,11 +1159,12 @@ class ClipboardData:
             return None
         selection_sets = []
         for vmap_id in self.vmap_ids:
-            vmap = self.VMap(vmap_id)
+            map_type, name = self._vmap_info[vmap_id]
             # Vertex selection set
-            if vmap.Type() == lx.symbol.i_VMAP_PICK:
+            if map_type == lx.symbol.i_VMAP_PICK:
+                vmap = self.VMap(vmap_id)
                 sset = {
-                    'name': vmap.Name(),
+                    'name': name,
                     'type': 'VERT',
                     'indices': []
                 }
@@ -1088,11 +1174,12 @@ class ClipboardData:
                         sset['indices'].append(i)
                 selection_sets.append(sset)
             # Edge selection set
-            elif vmap.Type() == lx.symbol.i_VMAP_EPCK:
-                if vmap.Name() == '_Freestyle':
+            elif map_type == lx.symbol.i_VMAP_EPCK:
+                if name == '_Freestyle':
                     continue
+                vmap = self.VMap(vmap_id)
                 sset = {
-                    'name': vmap.Name(),
+                    'name': name,
                     'type': 'EDGE',
                     'indices': []
                 }
@@ -1100,28 +1187,22 @@ class ClipboardData:
                     e = self.Edge(edge_id)
                     if self.getEdgePick(vmap, e) == True:
                         id0, id1 = e.Endpoints()
-                        sset['indices'].append([self.index(self.Point(id0)), self.index(self.Point(id1))])
+                        sset['indices'].append([self._point_index[id0], self._point_index[id1]])
                 selection_sets.append(sset)
         # Polygon selection set
         poly_sset = {}
         i = 0
         for poly_id in self.polygon_ids:
             p = self.Polygon(poly_id)
-            if self.is_keyhole(p):
-                count = p.GenerateTriangles()
-            else:
-                count = 1
+            count = self.face_count(poly_id)
             tagString = self.PickTag(p)
             if tagString is None:
                 i += count
                 continue
-            tags = tagString.split(";")
+            bucket_lists = [poly_sset.setdefault(tag, []) for tag in tagString.split(";")]
             for j in range(count):
-                for tag in tags:
-                    if tag not in poly_sset:
-                        poly_sset[tag] = [i]
-                    else:
-                        poly_sset[tag].append(i)
+                for bucket in bucket_lists:
+                    bucket.append(i)
                 i += 1
         for tag, indices in poly_sset.items():
             sset = {
@@ -1146,33 +1227,14 @@ class ClipboardData:
         i = 0
         for poly_id in self.polygon_ids:
             p = self.Polygon(poly_id)
-            if self.is_keyhole(p):
-                count = p.GenerateTriangles()
-                for j in range(count):
-                    face_normal = {
-                        'index': i,
-                        'values': []
-                    }
-                    i += 1
-                    n = 0
-                    for point_id in p.TriangleByIndex(j):
-                        vec = self.getNormal(vmap, p, point_id)
-                        if vec is None:
-                            face_normal['values'].append([0.0, 0.0, 0.0])
-                        else:
-                            face_normal['values'].append([vec[0], vec[1], vec[2]])
-                            n += 1
-                    if n > 0:
-                        normals.append(face_normal)
-            else:
+            for corners in self.face_corners(poly_id, p):
                 face_normal = {
                     'index': i,
                     'values': []
                 }
                 i += 1
                 n = 0
-                for j in range(p.VertexCount()):
-                    point_id = p.VertexByIndex(j)
+                for point_id in corners:
                     vec = self.getNormal(vmap, p, point_id)
                     if vec is None:
                         face_normal['values'].append([0.0, 0.0, 0.0])
@@ -1200,7 +1262,10 @@ class ClipboardData:
         return effect
     
     def get_imageMap_items(self):
-        return [item for item in self.scene.items() if item.type == 'imageMap']
+        # scanned once per copy_materials
+        if self._image_maps is None:
+            self._image_maps = list(self.scene.items('imageMap'))
+        return self._image_maps
 
     # extract textures from the material
     def copy_textures(self, material):
@@ -1277,6 +1342,7 @@ class ClipboardData:
                 break
         # Query Existing Materials
         self.materials = []
+        self._image_maps = None
         for material in self.scene.items("advancedMaterial"):
             mask = material.parent
             if not mask or mask.type != 'mask':
@@ -1297,6 +1363,11 @@ class ClipboardData:
             if textures is not None:
                 mat_data['textures'] = textures
             self.materials.append(mat_data)
+        self._image_maps = None
+        # material name to the first index in materials
+        self._material_name_to_index = {}
+        for i, mat in enumerate(self.materials):
+            self._material_name_to_index.setdefault(mat['name'], i)
         if len(self.materials) == 0:
             return None
         return self.materials
@@ -1305,15 +1376,43 @@ class ClipboardData:
     def copy_vertices(self):
         if len(self.vertex_ids) == 0:
             return None
+        point = self.point_accessor
+        select = point.Select
+        get_pos = point.Pos
         positions = []
+        append = positions.append
         for id in self.vertex_ids:
-            v = self.Point(id)
-            pos = v.Pos()
-            positions.append([pos[0], pos[1], pos[2]])
+            select(id)
+            append(get_pos())
         if len(positions) == 0:
             return None
         return positions
 
+    # values of an edge map keyed by edge id, visiting only the edges that
+    # have a value. None if the SDK can not enumerate edge maps.
+    def edge_map_values(self, vmap_id):
+        class EdgeMapVisitor(lxifc.Visitor):
+            def __init__(self, edge, vmap_id, storage, values):
+                self.edge = edge
+                self.vmap_id = vmap_id
+                self.storage = storage
+                self.values = values
+
+            def vis_Evaluate(self):
+                if self.edge.MapEvaluate(self.vmap_id, self.storage):
+                    self.values[self.edge.ID()] = self.storage.get()
+
+        if not hasattr(self.map_accessor, 'EnumerateEdges'):
+            return None
+        values = {}
+        visitor = EdgeMapVisitor(self.edge_accessor, vmap_id, self._buf_f1, values)
+        try:
+            self.map_accessor.Select(vmap_id)
+            self.map_accessor.EnumerateEdges(visitor, self.edge_accessor)
+        except Exception:
+            return None
+        return values
+
     # copy all selected edges
     def copy_edges(self):
         if len(self.polygon_ids) == 0:
@@ -1325,61 +1424,76 @@ class ClipboardData:
         id_seam_any = None
         id_hard = None
         for id in self.vmap_ids:
-            vmap = self.VMap(id)
-            if vmap.Type() == lx.symbol.i_VMAP_SUBDIV:
+            map_type, name = self._vmap_info[id]
+            if map_type == lx.symbol.i_VMAP_SUBDIV:
                 id_subdiv = id
-            elif vmap.Type() == i_VMAP_SEAM:
-                if vmap.Name() == '_Seam':
+            elif map_type == i_VMAP_SEAM:
+                if name == '_Seam':
                     id_seam = id
                 id_seam_any = id
-            elif vmap.Type() == lx.symbol.i_VMAP_HARDEDGE:
+            elif map_type == lx.symbol.i_VMAP_HARDEDGE:
                 id_hard = id
         if id_seam is None:
             id_seam = id_seam_any
-        # crease edges
-        crease_edges = [0.0] * self.mesh.EdgeCount()
-        if id_subdiv is not None:
-            storageBuffer = lx.object.storage('f', 1)
-            for i in range(self.mesh.EdgeCount()):
-                e = self.EdgeByIndex(i)
-                if e.MapEvaluate(id_subdiv, storageBuffer) == True:
-                    w = storageBuffer.get()
-                    # Blender's edge crease = sqrt (w) (See Blender's FBX importer)
-                    if w[0] > 0.0:
-                        crease_edges[i] = math.sqrt(w[0])
-        # uv seam edges
-        seam_edges = [False] * self.mesh.EdgeCount()
-        if id_seam is not None:
-            storageBuffer = lx.object.storage('f', 1)
-            for i in range(self.mesh.EdgeCount()):
-                e = self.EdgeByIndex(i)
-                if e.MapEvaluate(id_seam, storageBuffer) == True:
-                    seam_edges[i] = True
-        # hard edges
-        smooth_edges = [True] * self.mesh.EdgeCount()
-        if id_hard is not None:
-            storageBuffer = lx.object.storage('f', 1)
-            for i in range(self.mesh.EdgeCount()):
-                e = self.EdgeByIndex(i)
-                if e.MapEvaluate(id_hard, storageBuffer) == True:
-                    smooth_edges[i] = False
-            
-        # edges
+        # enumerate only the edges holding a value when the SDK allows it
+        map_values = [self.edge_map_values(id) if id is not None else {} for id in (id_subdiv, id_seam, id_hard)]
+        if None not in map_values:
+            return self.copy_edges_from_values(*map_values)
+        # crease, uv seam and hard edges in a single pass over the edges
+        # whose endpoints are both selected
         edges = []
-        for i in range(self.mesh.EdgeCount()):
-            e = self.EdgeByIndex(i)
-            if crease_edges[i] == 0.0 and seam_edges[i] == False and smooth_edges[i] == True:
+        storageBuffer = self._buf_f1
+        edge = self.edge_accessor
+        select_edge = edge.Select
+        map_evaluate = edge.MapEvaluate
+        point_index = self._point_index
+        for edge_id in self.edge_ids:
+            select_edge(edge_id)
+            crease = 0.0
+            if id_subdiv is not None and map_evaluate(id_subdiv, storageBuffer) == True:
+                w = storageBuffer.get()
+                # Blender's edge crease = sqrt (w) (See Blender's FBX importer)
+                if w[0] > 0.0:
+                    crease = math.sqrt(w[0])
+            seam = id_seam is not None and map_evaluate(id_seam, storageBuffer) == True
+            smooth = not (id_hard is not None and map_evaluate(id_hard, storageBuffer) == True)
+            if crease == 0.0 and seam == False and smooth == True:
                 continue
-            id0, id1 = e.Endpoints()
-            if self.selected_point(id0) and self.selected_point(id1):
-                edges.append({
-                    'vertices': [self.index(self.Point(id0)), self.index(self.Point(id1))],
-                    'attributes': {
-                        'crease_edge': crease_edges[i],
-                        'seam': seam_edges[i],
-                        'smooth': smooth_edges[i]
-                    }
-                })
+            id0, id1 = edge.Endpoints()
+            edges.append({
+                'vertices': [point_index[id0], point_index[id1]],
+                'attributes': {
+                    'crease_edge': crease,
+                    'seam': seam,
+                    'smooth': smooth
+                }
+            })
+        if len(edges) == 0:
+            return None
+        return edges
+
+    def copy_edges_from_values(self, subdiv_values, seam_values, hard_values):
+        edges = []
+        edge = self.edge_accessor
+        point_index = self._point_index
+        for edge_id in self.edge_ids:
+            w = subdiv_values.get(edge_id)
+            # Blender's edge crease = sqrt (w) (See Blender's FBX importer)
+            crease = math.sqrt(w[0]) if w is not None and w[0] > 0.0 else 0.0
+            seam = edge_id in seam_values
+            smooth = edge_id not in hard_values
+            if crease == 0.0 and seam == False and smooth == True:
+                continue
+            edge.Select(edge_id)
+            id0, id1 = edge.Endpoints()
+            edges.append({
+                'vertices': [point_index[id0], point_index[id1]],
+                'attributes': {
+                    'crease_edge': crease,
+                    'seam': seam,
+                    'smooth': smooth
+                }
+            })
         if len(edges) == 0:
             return None
         return edges
@@ -1389,29 +1503,20 @@ class ClipboardData:
         if len(self.polygon_ids) == 0:
             return None
         polygons = []
-        for id in self.polygon_ids:
-            p = self.Polygon(id)
-            p_attrs = {
-                'material_index': self.get_material_index(self.MaterialTag(p), self.materials)
-            }
-            if self.is_keyhole(p):
-                count = p.GenerateTriangles()
-                for i in range(count):
-                    vertices = []
-                    for id in p.TriangleByIndex(i):
-                        v = self.Point(id)
-                        vertices.append(self.index(v))
-                    polygons.append({
-                        'vertices': vertices,
-                        'attributes': p_attrs
-                    })
-            else:
-                vertices = []
-                for i in range(p.VertexCount()):
-                    v = self.Point(p.VertexByIndex(i))
-                    vertices.append(self.index(v))
+        point_index = self._point_index
+        # polygons with the same material tag share one attributes dict
+        attrs_by_tag = {}
+        for poly_id in self.polygon_ids:
+            p = self.Polygon(poly_id)
+            tag = self.MaterialTag(p)
+            p_attrs = attrs_by_tag.get(tag)
+            if p_attrs is None:
+                p_attrs = attrs_by_tag[tag] = {
+                    'material_index': self.get_material_index(tag)
+                }
+            for corners in self.face_corners(poly_id, p):
                 polygons.append({
-                    'vertices': vertices,
+                    'vertices': [point_index[id] for id in corners],
                     'attributes': p_attrs
                 })
         if len(polygons) == 0:
@@ -1423,15 +1528,7 @@ class ClipboardData:
         count = p.VertexCount()
         if count < 8:
             return False
-        edge_map = {}
-        for i in range(count):
-            id0 = p.VertexByIndex(i)
-            id1 = p.VertexByIndex((i + 1) % count)
-            if i > 2:
-                if (id1, id0) in edge_map:
-                    return True
-            edge_map[(id0, id1)] = True
-        return False
+        return has_bridge_edge([p.VertexByIndex(i) for i in range(count)])
 
     # set item parent
     def set_parents(self):
@@ -1507,14 +1604,14 @@ class ClipboardData:
         #print(f'Pasting from external clipboard: {external_clipboard}, new_mesh={new_mesh}')
         if external_clipboard == 'tempfile':
             path = get_cpmf_tempfile_path(use_bin=use_msgpack)
-            if use_msgpack and not os.path.exists(path):
-                path = get_cpmf_tempfile_path(use_bin=False)
-            lx.out(f'Read file from: {path}')
             if not path:
                 lx.out({'ERROR'}, 'No file path specified for import')
                 return False
+            path = resolve_tempfile_path(path)
+            lx.out(f'Read file from: {path}')
+            # read and parse
             try:
-                txt = read_tempfile(path)
+                self.data = read_tempfile(path)
             except Exception as e:
                 lx.out({'ERROR'}, f'Failed to read file: {e}')
                 return False
@@ -1524,19 +1621,22 @@ class ClipboardData:
             except Exception as e:
                 lx.out({'ERROR'}, f'Failed to read clipboard: {e}')
                 return False
-        # parse
-        if external_clipboard == 'tempfile' and use_msgpack:
-            try:
-                self.data = msgpack.unpackb(txt)
-            except Exception as e:
-                lx.out({'ERROR'}, f'Invalid msgpack: {e}')
-                return False
-        else:
+            # parse
             try:
-                self.data = json.loads(txt)
+                self.data = load_json(txt)
             except Exception as e:
                 lx.out({'ERROR'}, f'Invalid JSON: {e}')
                 return False
+            # large data was stored to the temporary file, the clipboard only
+            # holds a marker with its path
+            if 'tempfile' in self.data and 'objects' not in self.data:
+                path = self.data['tempfile']
+                lx.out(f'Read file from: {path}')
+                try:
+                    self.data = read_tempfile(path)
+                except Exception as e:
+                    lx.out({'ERROR'}, f'Failed to read file: {e}')
+                    return False
 
         self.replace_material = replace_material
         self.import_transform = import_transform
@@ -1680,20 +1780,24 @@ class ClipboardData:
     def paste_vertices(self, positions):
         self.vertex_ids = []
         self.base_nvert = self.mesh.PointCount()
-        for i, p in enumerate(positions):
-            v = convert_vector_from_coord(p, self.coord)
-            v *= self.unit_scale
-            id = self.newPoint((v.x, v.y, v.z))
+        coord = self.coord
+        scale = self.unit_scale
+        new_point = self.point_accessor.New
+        append = self.vertex_ids.append
+        for p in positions:
+            x, y, z = convert_vector_from_coord(p, coord)
+            append(new_point((x * scale, y * scale, z * scale)))
 
     def paste_polygons(self, polygons, materials):
         rev = self.reverse_face_winding()
         count = 0
         self.polygon_ids = []
+        vertex_ids = self.vertex_ids
         for poly in polygons:
             vert_indices = poly.get('vertices', [])
             if rev:
-                vert_indices.reverse()
-            face_verts = [self.vertex_ids[i] for i in vert_indices]
+                vert_indices = reversed(vert_indices)
+            face_verts = [vertex_ids[i] for i in vert_indices]
             p = self.newPolygon(face_verts)
             attributes = poly.get('attributes', {})
             if 'material_index' in attributes:
@@ -1721,39 +1825,37 @@ class ClipboardData:
         return self.edge_accessor
 
     def paste_edges(self, edges):
+        # resolve the edge attributes once, maps are added only when used
+        resolved = []
+        for edge in edges:
+            attributes = edge.get('attributes', {})
+            resolved.append((edge.get('vertices', []),
+                             attributes.get('crease_edge', 0.0),
+                             attributes.get('seam', False) is True,
+                             attributes.get('smooth', True) is False))
         # Subdivision map
-        vmap = self.lookupMap(lx.symbol.i_VMAP_SUBDIV, "Subdivision")
-        if vmap != None:
-            for edge in edges:
-                e = self.select_edge(edge.get('vertices', []))
-                if e is None:
-                    continue
-                weight = edge.get('attributes', {}).get('crease_edge', 0.0)
-                if weight > 0.0:
-                    # Blender's edge crease = sqrt (w) (See Blender's FBX importer)
-                    self.setSubdivWeight(vmap, e, weight * weight)
+        vmap_subdiv = self.lookupMap(lx.symbol.i_VMAP_SUBDIV, "Subdivision")
         # UV Seam map
-        vmap = self.lookupMap(i_VMAP_SEAM, "_Seam")
-        for edge in edges:
-            e = self.select_edge(edge.get('vertices', []))
-            if e is None:
-                continue
-            seam = edge.get('attributes', {}).get('seam', False)
-            if seam is True:
-                if vmap is None:
-                    vmap = self.addMap(i_VMAP_SEAM, "_Seam")
-                self.setEdgePick(vmap, e)
+        vmap_seam = self.lookupMap(i_VMAP_SEAM, "_Seam")
         # hard edge map
-        vmap = self.lookupMap(lx.symbol.i_VMAP_HARDEDGE, "Hard Edge")
-        for edge in edges:
-            e = self.select_edge(edge.get('vertices', []))
+        vmap_hard = self.lookupMap(lx.symbol.i_VMAP_HARDEDGE, "Hard Edge")
+        for vertices, weight, seam, hard in resolved:
+            if not (seam or hard or (vmap_subdiv is not None and weight > 0.0)):
+                continue
+            e = self.select_edge(vertices)
             if e is None:
                 continue
-            smooth = edge.get('attributes', {}).get('smooth', True)
-            if smooth is False:
-                if vmap is None:
-                    vmap = self.addMap(lx.symbol.i_VMAP_HARDEDGE, "Hard Edge")
-                self.setEdgePick(vmap, e)
+            if vmap_subdiv is not None and weight > 0.0:
+                # Blender's edge crease = sqrt (w) (See Blender's FBX importer)
+                self.setSubdivWeight(vmap_subdiv, e, weight * weight)
+            if seam:
+                if vmap_seam is None:
+                    vmap_seam = self.addMap(i_VMAP_SEAM, "_Seam")
+                self.setEdgePick(vmap_seam, e)
+            if hard:
+                if vmap_hard is None:
+                    vmap_hard = self.addMap(lx.symbol.i_VMAP_HARDEDGE, "Hard Edge")
+                self.setEdgePick(vmap_hard, e)
 
     def get_type_name(self, type):
         if type == 'base_color':
@@ -1871,53 +1973,57 @@ class ClipboardData:
             self.paste_textures(material, mask)
 
 
+    # write face corner values of one vertex map, faces yields (face index, values)
+    def paste_corner_values(self, vmap, faces, storage, rev):
+        vmap_id = vmap.ID()
+        polygon = self.polygon_accessor
+        select = polygon.Select
+        vertex_by_index = polygon.VertexByIndex
+        set_map_value = polygon.SetMapValue
+        set_storage = storage.set
+        polygon_ids = self.polygon_ids
+        for index, values in faces:
+            if rev:
+                values = values[::-1]
+            select(polygon_ids[index])
+            for i in range(polygon.VertexCount()):
+                set_storage(values[i])
+                set_map_value(vertex_by_index(i), vmap_id, storage)
+
+    def paste_uv_set(self, uv_set, rev):
+        name = uv_set.get('name', '')
+        vmap = self.lookupMap(lx.symbol.i_VMAP_TEXTUREUV, name)
+        if not vmap:
+            vmap = self.addMap(lx.symbol.i_VMAP_TEXTUREUV, name)
+        faces = ((face_uvs.get('index'), face_uvs.get('values', [])) for face_uvs in uv_set.get('uvs', []))
+        self.paste_corner_values(vmap, faces, self._buf_f2, rev)
+
     def paste_uv_sets(self, uv_sets):
         rev = self.reverse_face_winding()
         for uv_set in uv_sets:
-            name = uv_set.get('name', '')
-            vmap = self.lookupMap(lx.symbol.i_VMAP_TEXTUREUV, name)
-            if not vmap:
-                vmap = self.addMap(lx.symbol.i_VMAP_TEXTUREUV, name)
-            for face_uvs in uv_set.get('uvs', []):
-                index = face_uvs.get('index')
-                values = face_uvs.get('values', [])
-                if rev:
-                    values.reverse()
-                poly_id = self.polygon_ids[index]
-                p = self.Polygon(poly_id)
-                for i in range(p.VertexCount()):
-                    point_id = p.VertexByIndex(i)
-                    uv = values[i]
-                    self.setUV(vmap, p, point_id, uv)
+            self.paste_uv_set(uv_set, rev)
 
+    def paste_color(self, color, rev):
+        name = color.get('name', '')
+        domain = color.get('domain', '')
+        vmap = self.lookupMap(lx.symbol.i_VMAP_RGBA, name)
+        if not vmap:
+            vmap = self.addMap(lx.symbol.i_VMAP_RGBA, name)
+        if domain == 'CORNER':
+            faces = ((face_color.get('index'), face_color.get('values', [])) for face_color in color.get('colors', []))
+            self.paste_corner_values(vmap, faces, self._buf_f4, rev)
+        elif domain == 'POINT':
+            for point_color in color.get('colors', []):
+                index = point_color.get('index')
+                values = point_color.get('values', [])
+                point_id = self.vertex_ids[index]
+                v = self.Point(point_id)
+                self.setPointColor(vmap, v, values)
 
     def paste_colors(self, colors):
         rev = self.reverse_face_winding()
         for color in colors:
-            name = color.get('name', '')
-            domain = color.get('domain', '')
-            vmap = self.lookupMap(lx.symbol.i_VMAP_RGBA, name)
-            if not vmap:
-                vmap = self.addMap(lx.symbol.i_VMAP_RGBA, name)
-            if domain == 'CORNER':
-                for face_color in color.get('colors', []):
-                    index = face_color.get('index')
-                    values = face_color.get('values', [])
-                    if rev:
-                        values.reverse()
-                    poly_id = self.polygon_ids[index]
-                    p = self.Polygon(poly_id)
-                    for i in range(p.VertexCount()):
-                        point_id = p.VertexByIndex(i)
-                        color = values[i]
-                        self.setCornerColor(vmap, p, point_id, color)
-            elif domain == 'POINT':
-                for point_color in color.get('colors', []):
-                    index = point_color.get('index')
-                    color = point_color.get('values', [])
-                    point_id = self.vertex_ids[index]
-                    v = self.Point(point_id)
-                    self.setPointColor(vmap, v, color)
+            self.paste_color(color, rev)
 
     def paste_vertex_groups(self, vertex_groups):
         for vertex_group in vertex_groups:
@@ -1933,34 +2039,43 @@ class ClipboardData:
                 self.setWeight(vmap, v, weight)
 
     def paste_vertex_shapekeys(self, shapekeys):
+        coord = self.coord
+        scale = self.unit_scale
         base_positions = None
         for shapekey in shapekeys:
             name = shapekey.get('name')
-            lx.out(f"shapekey {name} {name.lower()}")
+            if debug_log:
+                lx.out(f"shapekey {name} {name.lower()}")
             if name.lower() == 'basis':
-                base_positions = shapekey.get('positions', [])
+                # converted and scaled once for all relative shapekeys
+                base_positions = []
+                for base_data in shapekey.get('positions', []):
+                    x, y, z = convert_vector_from_coord(base_data.get('position'), coord)
+                    base_positions.append((x * scale, y * scale, z * scale))
                 continue
             use_relative = shapekey.get('relative', True)
             map_type = lx.symbol.i_VMAP_MORPH if use_relative else lx.symbol.i_VMAP_SPOT
             vmap = self.lookupMap(lx.symbol.i_VMAP_WEIGHT, name)
             if not vmap:
                 vmap = self.addMap(map_type, name)
+            vmap_id = vmap.ID()
+            storage = self._buf_f3
+            point = self.point_accessor
+            select = point.Select
+            vertex_ids = self.vertex_ids
             for pos_data in shapekey.get('positions', []):
                 index = pos_data.get('index')
-                pos = modo.Vector3(pos_data.get('position'))
-                pos = convert_vector_from_coord(pos, self.coord)
-                pos *= self.unit_scale
-                v = self.Point(self.vertex_ids[index])
+                x, y, z = convert_vector_from_coord(pos_data.get('position'), coord)
+                x, y, z = x * scale, y * scale, z * scale
+                select(vertex_ids[index])
                 if use_relative:
                     if base_positions is None:
-                        pos -= v.Pos()
+                        bx, by, bz = point.Pos()
                     else:
-                        base_data = base_positions[index]
-                        base_pos = modo.Vector3(base_data.get('position'))
-                        base_pos = convert_vector_from_coord(base_pos, self.coord)
-                        base_pos *= self.unit_scale
-                        pos -= base_pos
-                self.setMorph(vmap, v, pos)
+                        bx, by, bz = base_positions[index]
+                    x, y, z = x - bx, y - by, z - bz
+                storage.set((x, y, z))
+                point.SetMapValue(vmap_id, storage)
 
     def paste_edge_freestyle(self, freestyle_edges):
         name = '_Freestyle'
@@ -2021,7 +2136,7 @@ class ClipboardData:
             index = face_normal.get('index')
             values = face_normal.get('values', [])
             if rev:
-                values.reverse()
+                values = values[::-1]
             poly_id = self.polygon_ids[index]
             p = self.Polygon(poly_id)
             for i in range(p.VertexCount()):
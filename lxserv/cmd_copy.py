@@ -24,17 +24,21 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import lx
 import lxu.command
 import clipboard
+import cmd_settings
+
+CMD_FLAGS = lx.symbol.fCMD_MODEL | lx.symbol.fCMD_UNDO
 
 class ClipboardCopy(lxu.command.BasicCommand):
 
     def __init__(self):
-        lx.out("ClipboardCopy: initializing")
+        if clipboard.debug_log:
+            lx.out("ClipboardCopy: initializing")
         lxu.command.BasicCommand.__init__(self)
         self.dyna_Add("cut", lx.symbol.sTYPE_BOOLEAN)
         self.basic_SetFlags(0, lx.symbol.fCMDARG_OPTIONAL)
 
     def cmd_Flags(self):
-        return lx.symbol.fCMD_MODEL | lx.symbol.fCMD_UNDO
+        return CMD_FLAGS
 
     def basic_Enable(self, msg):
         return True
@@ -43,8 +47,9 @@ class ClipboardCopy(lxu.command.BasicCommand):
         pass
 
     def basic_Execute(self, msg, flags):
-        type = lx.eval("clipboard.settings type:?")
-        lx.out(f"ClipboardCopy: Executing Copy to External {type}")
+        type = cmd_settings.get_settings().type
+        if clipboard.debug_log:
+            lx.out(f"ClipboardCopy: Executing Copy to External {type}")
         clipboard.ClipboardData().copy(external_clipboard=type)
         cut = self.dyna_Int(0)
         if cut:
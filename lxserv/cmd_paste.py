@@ -23,6 +23,27 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import lx
 import lxu.command
 import clipboard
+import cmd_settings
+
+CMD_FLAGS = lx.symbol.fCMD_MODEL | lx.symbol.fCMD_UNDO
+
+# True if none of the active mesh layers has geometry to delete
+def active_meshes_empty():
+    layer_svc = lx.service.Layer()
+    scan = layer_svc.ScanAllocate(lx.symbol.f_LAYERSCAN_ACTIVE)
+    if scan.test() == False:
+        return True
+    try:
+        for layer_index in range(scan.Count()):
+            mesh = lx.object.Mesh(scan.MeshBase(layer_index))
+            if mesh.PointCount() > 0 or mesh.PolygonCount() > 0:
+                return False
+        return True
+    finally:
+        # release the scan before select.delete and the paste open their own
+        mesh = None
+        scan.Apply()
+        scan = None
 
 class ClipboardPaste(lxu.command.BasicCommand):
 
@@ -32,7 +53,7 @@ class ClipboardPaste(lxu.command.BasicCommand):
         self.basic_SetFlags(0, lx.symbol.fCMDARG_OPTIONAL)
 
     def cmd_Flags(self):
-        return lx.symbol.fCMD_MODEL | lx.symbol.fCMD_UNDO
+        return CMD_FLAGS
 
     def basic_Enable(self, msg):
         return True
@@ -41,13 +62,18 @@ class ClipboardPaste(lxu.command.BasicCommand):
         pass
 
     def basic_Execute(self, msg, flags):
-        type = lx.eval("clipboard.settings type:?")
-        replace_mesh = lx.eval("clipboard.settings replace_mesh:?")
-        replace_material = lx.eval("clipboard.settings replace_material:?")
-        import_transform = lx.eval("clipboard.settings import_transform:?")
+        # read the settings in process instead of querying clipboard.settings
+        settings = cmd_settings.get_settings()
+        type = settings.type
+        replace_mesh = settings.replace_mesh
+        replace_material = settings.replace_material
+        import_transform = settings.import_transform
         new_mesh = self.dyna_Int(0)
-        lx.out(f"ClipboardPaste: Executing Paste to External new_mesh {new_mesh} type {type} import_transform {import_transform}")
-        if replace_mesh and new_mesh == 0:
+        if clipboard.debug_log:
+            lx.out(f"ClipboardPaste: Executing Paste to External new_mesh {new_mesh} type {type} import_transform {import_transform}")
+        # an empty selection makes select.delete remove the whole layer, so
+        # it can only be skipped when there is nothing to remove
+        if replace_mesh and new_mesh == 0 and not active_meshes_empty():
             lx.eval("select.delete")
         clipboard.ClipboardData().paste(external_clipboard=type, \
                                         new_mesh=new_mesh, \
@@ -22,16 +22,22 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import lx
 import lxifc
 import lxu.command
+from collections import namedtuple
 
-types = [('tempfile', 'clipboard',),
-         ('Temporary File', 'OS Clipboard',)]
+# symbols read on every settings query and execute, and by the UI value
+# hints of the type popup
+sTYPE_STRING = lx.symbol.sTYPE_STRING
+fVALHINT_POPUPS = lx.symbol.fVALHINT_POPUPS
+
+types = (('tempfile', 'clipboard',),
+         ('Temporary File', 'OS Clipboard',))
 
 class TypePopup(lxifc.UIValueHints):
     def __init__(self, items):
         self._items = items
 
     def uiv_Flags(self):
-        return lx.symbol.fVALHINT_POPUPS
+        return fVALHINT_POPUPS
 
     def uiv_PopCount(self):
         return len(self._items[0])
@@ -42,60 +48,48 @@ class TypePopup(lxifc.UIValueHints):
     def uiv_PopInternalName(self,index):
         return self._items[0][index]
 
+# name, value type, default value and label of each setting, in argument order
+settings = (('type', sTYPE_STRING, 'tempfile', 'Type'),
+            ('replace_mesh', lx.symbol.sTYPE_BOOLEAN, 0, 'Replace Mesh'),
+            ('replace_material', lx.symbol.sTYPE_BOOLEAN, 0, 'Replace Material'),
+            ('import_transform', lx.symbol.sTYPE_BOOLEAN, 0, 'Import Transform'))
+
 class PersistData(object):
     def __init__(self):
-        self.type = None
-        self.type_val = 'tempfile'
-        self.replace_mesh = None
-        self.replace_mesh_val = 0
-        self.replace_material = None
-        self.replace_material_val = 0
-        self.import_transform = None
-        self.import_transform_val = 0
-
-    def get_type(self):
-        try:
-            return self.type_val.GetString(0)
-        except:
-            return 'tempfile'
-
-    def set_type(self, type):
-        self.type.Append()
-        self.type_val.SetString(0, type)
-
-    def get_replace_mesh(self):
-        try:
-            return self.replace_mesh_val.GetInt(0)
-        except:
-            return 0
-
-    def set_replace_mesh(self, replace_mesh):
-        self.replace_mesh.Append()
-        self.replace_mesh_val.SetInt(0, replace_mesh)
-
-    def get_replace_material(self):
-        try:
-            return self.replace_material_val.GetInt(0)
-        except:
-            return 0
-
-    def set_replace_material(self, replace_material):
-        self.replace_material.Append()
-        self.replace_material_val.SetInt(0, replace_material)
-
-    def get_import_transform(self):
-        try:
-            return self.import_transform_val.GetInt(0)
-        except:
-            return 0
-
-    def set_import_transform(self, import_transform):
-        self.import_transform.Append()
-        self.import_transform_val.SetInt(0, import_transform)
+        # name -> (atom, attributes, value type), filled when the persistent
+        # atoms are configured
+        self._atoms = {}
+        self._defaults = {name: default for name, _, default, _ in settings}
+
+    def get(self, name):
+        entry = self._atoms.get(name)
+        if entry is None:
+            return self._defaults[name]
+        atom, val, value_type = entry
+        # the atom has no value until the setting is changed for the first time
+        if atom.Count() == 0:
+            return self._defaults[name]
+        if value_type == sTYPE_STRING:
+            return val.GetString(0)
+        return val.GetInt(0)
+
+    def set(self, name, value):
+        atom, val, value_type = self._atoms[name]
+        atom.Append()
+        if value_type == sTYPE_STRING:
+            val.SetString(0, value)
+        else:
+            val.SetInt(0, value)
 
 
 persist_data = None
 
+# persistence service, looked up once
+persist_svc = lx.service.Persistence()
+
+# shared by all settings commands, the popup items never change
+type_popup = TypePopup(types)
+
 #
 # <atom type="ClipboardSettings">
 #    <atom type="type">tempfile</atom>
@@ -104,88 +98,78 @@ persist_data = None
 class VisClipboardSettings(lxifc.Visitor):
     def vis_Evaluate(self):
         global persist_data
-        persist_svc = lx.service.Persistence()
-
-        persist_svc.Start("type", lx.symbol.i_PERSIST_ATOM)
-        persist_svc.AddValue(lx.symbol.sTYPE_STRING)
-        persist_data.type = persist_svc.End()
-        persist_data.type_val = lx.object.Attributes(persist_data.type)
-
-        persist_svc.Start ("replace_mesh", lx.symbol.i_PERSIST_ATOM)
-        persist_svc.AddValue (lx.symbol.sTYPE_BOOLEAN)
-        persist_data.replace_mesh = persist_svc.End ()
-        persist_data.replace_mesh_val = lx.object.Attributes (persist_data.replace_mesh)
-
-        persist_svc.Start ("replace_material", lx.symbol.i_PERSIST_ATOM)
-        persist_svc.AddValue (lx.symbol.sTYPE_BOOLEAN)
-        persist_data.replace_material = persist_svc.End ()
-        persist_data.replace_material_val = lx.object.Attributes (persist_data.replace_material)
-
-        persist_svc.Start ("import_transform", lx.symbol.i_PERSIST_ATOM)
-        persist_svc.AddValue (lx.symbol.sTYPE_BOOLEAN)
-        persist_data.import_transform = persist_svc.End ()
-        persist_data.import_transform_val = lx.object.Attributes (persist_data.import_transform)
+        start = persist_svc.Start
+        add_value = persist_svc.AddValue
+        end = persist_svc.End
+        atoms = persist_data._atoms
+        i_PERSIST_ATOM = lx.symbol.i_PERSIST_ATOM
+
+        for name, value_type, _, _ in settings:
+            start(name, i_PERSIST_ATOM)
+            add_value(value_type)
+            atom = end()
+            atoms[name] = (atom, lx.object.Attributes(atom), value_type)
 
         return lx.symbol.e_OK
 
 def persist_setup():
     global persist_data
-    if persist_data:
+    if persist_data is not None:
         return
     persist_data = PersistData()
-    persist_svc = lx.service.Persistence()
     persist_vis = VisClipboardSettings()
     persist_svc.Configure('ClipboardSettings', persist_vis)
 
+Settings = namedtuple('Settings', [name for name, _, _, _ in settings])
+
+# current settings for commands running in this interpreter, without going
+# through a clipboard.settings query
+def get_settings():
+    if persist_data is None:
+        persist_setup()
+    return Settings(*[persist_data.get(name) for name, _, _, _ in settings])
+
 class CmdClipboardSettings(lxu.command.BasicCommand):
     global persist_data
     def __init__(self):
         lxu.command.BasicCommand.__init__(self)
-        persist_setup()
-        self.dyna_Add('type', lx.symbol.sTYPE_STRING)
-        self.basic_SetFlags(0, lx.symbol.fCMDARG_QUERY | lx.symbol.fCMDARG_OPTIONAL)
-        self.dyna_Add('replace_mesh', lx.symbol.sTYPE_BOOLEAN)
-        self.basic_SetFlags(1, lx.symbol.fCMDARG_QUERY | lx.symbol.fCMDARG_OPTIONAL)
-        self.dyna_Add('replace_material', lx.symbol.sTYPE_BOOLEAN)
-        self.basic_SetFlags(2, lx.symbol.fCMDARG_QUERY | lx.symbol.fCMDARG_OPTIONAL)
-        self.dyna_Add('import_transform', lx.symbol.sTYPE_BOOLEAN)
-        self.basic_SetFlags(3, lx.symbol.fCMDARG_QUERY | lx.symbol.fCMDARG_OPTIONAL)
+        for index, (name, value_type, _, _) in enumerate(settings):
+            self.dyna_Add(name, value_type)
+            self.basic_SetFlags(index, lx.symbol.fCMDARG_QUERY | lx.symbol.fCMDARG_OPTIONAL)
+        # wrapper rebound to the query value array on each cmd_Query
+        self._va = lx.object.ValueArray()
 
     def arg_UIHints(self, index, hints):
-        if index == 0:
-            hints.Label("Type")
-        elif index == 1:
-            hints.Label("Replace Mesh")
-        elif index == 2:
-            hints.Label("Replace Material")
-        elif index == 3:
-            hints.Label("Import Transform")
+        if index < len(settings):
+            hints.Label(settings[index][3])
 
     def arg_UIValueHints(self, index):
         if index == 0:
-            return TypePopup(types)
+            return type_popup
 
     def basic_Execute(self, msg, flags):
-        if self.dyna_IsSet(0):
-            persist_data.set_type(self.dyna_String(0))
-        if self.dyna_IsSet(1):
-            persist_data.set_replace_mesh(self.dyna_Int(1))
-        if self.dyna_IsSet(2):
-            persist_data.set_replace_material(self.dyna_Int(2))
-        if self.dyna_IsSet(3):
-            persist_data.set_import_transform(self.dyna_Int(3))
+        # persistence is set up on first use, not per command instance
+        if persist_data is None:
+            persist_setup()
+        for index, (name, value_type, _, _) in enumerate(settings):
+            if not self.dyna_IsSet(index):
+                continue
+            if value_type == sTYPE_STRING:
+                persist_data.set(name, self.dyna_String(index))
+            else:
+                persist_data.set(name, self.dyna_Int(index))
 
     def cmd_Query(self,index,vaQuery):
-        va = lx.object.ValueArray()
+        if persist_data is None:
+            persist_setup()
+        va = self._va
         va.set(vaQuery)
-        if index == 0:
-            va.AddString(persist_data.get_type())
-        elif index == 1:
-            va.AddInt(persist_data.get_replace_mesh())
-        elif index == 2:
-            va.AddInt(persist_data.get_replace_material())
-        elif index == 3:
-            va.AddInt(persist_data.get_import_transform())
+        if index < len(settings):
+            name, value_type, _, _ = settings[index]
+            if value_type == sTYPE_STRING:
+                va.AddString(persist_data.get(name))
+            else:
+                va.AddInt(persist_data.get(name))
         return lx.result.OK
 
 # bless the command to register it as a first class server (plugin)